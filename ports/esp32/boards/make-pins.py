@@ -50,8 +50,7 @@ class Esp32PinGenerator(boardgen.NumericPinGenerator):
         super().__init__(pin_type=Esp32Pin)
 
         # Pre-define the pins (i.e. don't require them to be listed in pins.csv).
-        for i in range(NUM_GPIOS):
-            self.add_cpu_pin("GPIO{}".format(i))
+        self.add_cpu_pins_bulk("GPIO{}".format(i) for i in range(NUM_GPIOS))
 
     # Only use pre-defined cpu pins (do not let board.csv create them).
     def find_pin_by_cpu_pin_name(self, cpu_pin_name, create=True):
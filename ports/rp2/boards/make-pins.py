@@ -140,10 +140,8 @@ class Rp2PinGenerator(boardgen.NumericPinGenerator):
         if NUM_EXT_GPIOS is None:
             NUM_EXT_GPIOS = 0
         # Pre-define the pins (i.e. don't require them to be listed in pins.csv).
-        for i in range(NUM_GPIOS):
-            self.add_cpu_pin("GPIO{}".format(i))
-        for i in range(NUM_EXT_GPIOS):
-            self.add_cpu_pin("EXT_GPIO{}".format(i))
+        self.add_cpu_pins_bulk("GPIO{}".format(i) for i in range(NUM_GPIOS))
+        self.add_cpu_pins_bulk("EXT_GPIO{}".format(i) for i in range(NUM_EXT_GPIOS))
 
         super().load_inputs(out_source)
 
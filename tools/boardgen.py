@@ -69,6 +69,7 @@
 
 import argparse
 import csv
+import functools
 import os
 import sys
 
@@ -77,15 +78,55 @@ class PinGeneratorError(Exception):
     pass
 
 
+# Sentinel for "not yet computed" cache entries (None is a valid result).
+_MISSING = object()
+
+# Templates for the per-pin output lines, precompiled at module level so the
+# emit loops only pay for the substitution (%-formatting has the least
+# overhead of CPython's formatting options for simple string substitution).
+_ROM_MAP_ENTRY = "    { MP_ROM_QSTR(MP_QSTR_%s), MP_ROM_PTR(pin_%s) },"
+_BOARD_DEFINE = "#define %spin_%s pin_%s"
+
+
+# Most pins.csv and af.csv inputs have one record per line with no quoting
+# or escaping, so tokenizing is just a split per line (much faster than the
+# csv module's general-purpose state machine).  However, some af.csv files
+# do use quoted cells, which may contain embedded commas (e.g.
+# "JTAG_TMS,SWD_DIO" in the mimxrt af.csv files) or embedded newlines (e.g.
+# "TMS/\nSWDIO" in ra6m1_af.csv), so if the file contains a quote anywhere
+# hand the whole file to csv.reader instead, which handles both.  Yields
+# (linenum, row) with blank and "#" comment rows skipped; linenum is
+# zero-based, for error messages (in the quoted case it is the record
+# number, matching what csv.reader over the file used to report).
+def _parse_simple_csv(filename):
+    with open(filename, "r") as csvfile:
+        contents = csvfile.read()
+    if '"' in contents:
+        for linenum, row in enumerate(csv.reader(contents.splitlines(keepends=True))):
+            if not row or row[0].startswith("#"):
+                continue
+            yield linenum, row
+    else:
+        for linenum, line in enumerate(contents.splitlines()):
+            line = line.strip()
+            if not line or line[:1] == "#":
+                continue
+            yield linenum, line.split(",")
+
+
 # A port should define a subclass of Pin that knows how to validate cpu/board
 # names and emits the required structures.
 class Pin:
     def __init__(self, cpu_pin_name):
         self._cpu_pin_name = cpu_pin_name
-        # Optional aliases for the board from pins.csv. Each entry is a tuple
-        # of (name, hidden). Hidden board pins are in pins.csv with with a "-"
-        # prefix and will available to C but not Python.
-        self._board_pin_names = set()
+        # Optional aliases for the board from pins.csv, mapping name to
+        # hidden. Hidden board pins are in pins.csv with with a "-" prefix
+        # and will available to C but not Python. A dict rather than a list
+        # or a set of tuples: iteration follows insertion (i.e. pins.csv)
+        # order, so the emitted output is deterministic (which keeps ccache
+        # effective on rebuilds), while duplicate names still collapse to a
+        # single entry without a linear membership scan.
+        self._board_pin_names = {}
         # An unavailable pin is one that is not explicitly mentioned at all in
         # pins.csv (or added explicitly with PinGenerator.add_cpu_pin).
         self._available = False
@@ -94,6 +135,12 @@ class Pin:
         self._hidden = False
         # Reference to the PinGenerator instance.
         self._generator = None
+        # Lazily-populated caches for name() and index_name(), which may be
+        # overridden by ports with non-trivial implementations but are called
+        # several times per pin during the emit passes.  See
+        # PinGenerator._name and PinGenerator._index_name.
+        self._name_cache = None
+        self._index_name_cache = _MISSING
 
     # The name of the pin to use in MP_QSTR_{} or pin_{}. Defaults to the cpu name.
     def name(self):
@@ -101,25 +148,28 @@ class Pin:
 
     # Add a board alias (e.g. from pins.csv).
     def add_board_pin_name(self, board_pin_name, hidden=False):
-        self._board_pin_names.add(
-            (
-                board_pin_name,
-                hidden,
-            )
-        )
+        self._board_pin_names[board_pin_name] = hidden
 
     # Override this to handle an af specified in af.csv.
     def add_af(self, af_idx, af_name, af):
         raise NotImplementedError
 
     # Override this to verify that naming matches the MCU standard (e.g. "GPIOn" or "PXn").
+    # The same names are validated repeatedly (af.csv and pins.csv reference
+    # overlapping pin sets), so successful validations are memoized.
+    # Overrides doing non-trivial (e.g. regex) work should apply
+    # functools.lru_cache too, if they are pure functions of the name.
+    # lru_cache doesn't cache raised exceptions, so only the success path is
+    # skipped on repeat names.
     @staticmethod
+    @functools.lru_cache(maxsize=None)
     def validate_cpu_pin_name(cpu_pin_name):
         if not cpu_pin_name.strip():
             raise PinGeneratorError("Missing cpu pin name")
 
     # Override this to provide additional validation of board names.
     @staticmethod
+    @functools.lru_cache(maxsize=None)
     def validate_board_pin_name(board_pin_name):
         # TODO: ensure this is a valid Python/C identifier and can be used as MP_QSTR_foo.
         pass
@@ -170,10 +220,33 @@ class Pin:
 class PinGenerator:
     def __init__(self, pin_type, enable_af=False):
         self._pins = []
+        # Index of cpu pin name to pin, kept in sync with self._pins (which
+        # stays a list to preserve the output ordering).
+        self._pins_by_cpu_name = {}
         self._pin_type = pin_type
         self._enable_af = enable_af
         self._pin_cpu_num_entries = 0
         self._pin_board_num_entries = 0
+        # Snapshots of the pin lists used by the emit passes, computed once
+        # by _finalize() after all inputs have been loaded.
+        self._emit_available = []
+        self._emit_cpu = []
+        self._emit_board_aliases = []
+
+    # Snapshot the pin lists used by the emit passes, so each pass iterates
+    # a plain list instead of re-running the available_pins generator (and
+    # its per-pin filters).  This runs from main() once load_inputs has
+    # returned (it can't run inside the base load_inputs, because some ports,
+    # e.g. zephyr, add pins after calling super().load_inputs).
+    def _finalize(self):
+        self._emit_available = [pin for pin in self._pins if pin._available]
+        self._emit_cpu = [pin for pin in self._emit_available if not pin._hidden]
+        self._emit_board_aliases = [
+            (board_pin_name, pin)
+            for pin in self._emit_available
+            for board_pin_name, board_hidden in pin._board_pin_names.items()
+            if not board_hidden
+        ]
 
     # Allows a port to define a known cpu pin (without relying on it being in the
     # csv file).
@@ -181,9 +254,32 @@ class PinGenerator:
         pin = self._pin_type(cpu_pin_name)
         pin._available = available
         self._pins.append(pin)
+        self._pins_by_cpu_name[cpu_pin_name] = pin
         pin._generator = self
         return pin
 
+    # Cached equivalent of pin.name(), computed once per pin.
+    def _name(self, pin):
+        n = pin._name_cache
+        if n is None:
+            n = pin._name_cache = pin.name()
+        return n
+
+    # Cached equivalent of pin.index_name(), computed once per pin.
+    def _index_name(self, pin):
+        n = pin._index_name_cache
+        if n is _MISSING:
+            n = pin._index_name_cache = pin.index_name()
+        return n
+
+    # Allows a port that knows its full cpu pin set up front to define the
+    # pins in one pass (before the csv files are parsed), so that
+    # find_pin_by_cpu_pin_name always hits the index and never has to create
+    # pins from inside the per-row parse loops.
+    def add_cpu_pins_bulk(self, cpu_pin_names, available=True):
+        for cpu_pin_name in cpu_pin_names:
+            self.add_cpu_pin(cpu_pin_name, available=available)
+
     # Iterate just the available pins (i.e. ones in pins.csv).
     def available_pins(self, exclude_hidden=False):
         for pin in self._pins:
@@ -199,89 +295,118 @@ class PinGenerator:
 
     # Load board->cpu mapping from csv.
     def parse_board_csv(self, filename):
-        with open(filename, "r") as csvfile:
-            rows = csv.reader(csvfile)
-            for linenum, row in enumerate(rows):
-                try:
-                    # Skip empty lines, and lines starting with "#".
-                    if len(row) == 0 or row[0].startswith("#"):
-                        continue
-
-                    # Lines must be pairs of names.
-                    if len(row) != 2:
-                        raise PinGeneratorError("Expecting two entries in each row")
-                    board_pin_name, cpu_pin_name = (x.strip() for x in row)
-
-                    # All rows must include a cpu name.
-                    cpu_hidden = False
-                    if cpu_pin_name.startswith("-"):
-                        cpu_hidden = True
-                        cpu_pin_name = cpu_pin_name[1:]
-                    self._pin_type.validate_cpu_pin_name(cpu_pin_name)
-                    pin = self.find_pin_by_cpu_pin_name(cpu_pin_name, create=True)
-                    pin._available = True  # It's in pins.csv so must be available.
-                    pin._hidden = cpu_hidden  # Optionally don't make available to Python.
-
-                    # Rows can optionally alias to a board name.
-                    if board_pin_name:
-                        board_hidden = False
-                        if board_pin_name.startswith("-"):
-                            board_hidden = True
-                            board_pin_name = board_pin_name[1:]
-                        self._pin_type.validate_board_pin_name(board_pin_name)
-                        pin.add_board_pin_name(board_pin_name, board_hidden)
-
-                # Inject "file:line: " into the exception.
-                except PinGeneratorError as er:
-                    raise PinGeneratorError("{}:{}: {}".format(filename, linenum, er))
+        # Bind methods used on every row as locals, to keep attribute lookups
+        # out of the hot loop.
+        validate_cpu_pin_name = self._pin_type.validate_cpu_pin_name
+        validate_board_pin_name = self._pin_type.validate_board_pin_name
+        find_pin_by_cpu_pin_name = self.find_pin_by_cpu_pin_name
+
+        # When the port hasn't overridden a validator, skip the call
+        # altogether: the default cpu validator only checks that the name is
+        # non-empty (inlined below, the names are already stripped), and the
+        # default board validator is a no-op.
+        if validate_cpu_pin_name is Pin.validate_cpu_pin_name:
+            validate_cpu_pin_name = None
+        if validate_board_pin_name is Pin.validate_board_pin_name:
+            validate_board_pin_name = None
+
+        for linenum, row in _parse_simple_csv(filename):
+            try:
+                # Lines must be pairs of names.
+                if len(row) != 2:
+                    raise PinGeneratorError("Expecting two entries in each row")
+                # Index directly rather than unpacking a generator
+                # expression, which would allocate a generator frame for
+                # every row.
+                board_pin_name = row[0].strip()
+                cpu_pin_name = row[1].strip()
+
+                # All rows must include a cpu name.
+                cpu_hidden = False
+                if cpu_pin_name[:1] == "-":
+                    cpu_hidden = True
+                    cpu_pin_name = cpu_pin_name[1:]
+                if validate_cpu_pin_name:
+                    validate_cpu_pin_name(cpu_pin_name)
+                elif not cpu_pin_name:
+                    raise PinGeneratorError("Missing cpu pin name")
+                pin = find_pin_by_cpu_pin_name(cpu_pin_name, create=True)
+                pin._available = True  # It's in pins.csv so must be available.
+                pin._hidden = cpu_hidden  # Optionally don't make available to Python.
+
+                # Rows can optionally alias to a board name.
+                if board_pin_name:
+                    board_hidden = False
+                    if board_pin_name[:1] == "-":
+                        board_hidden = True
+                        board_pin_name = board_pin_name[1:]
+                    if validate_board_pin_name:
+                        validate_board_pin_name(board_pin_name)
+                    pin.add_board_pin_name(board_pin_name, board_hidden)
+
+            # Inject "file:line: " into the exception.
+            except PinGeneratorError as er:
+                raise PinGeneratorError("{}:{}: {}".format(filename, linenum, er))
 
     def parse_af_csv(self, filename, header_rows=1, pin_col=0, af_col=1):
         headings = {}
-        with open(filename, "r") as csvfile:
-            rows = csv.reader(csvfile)
-            for linenum, row in enumerate(rows):
-                try:
-                    # Skip empty lines, and lines starting with "#".
-                    if len(row) == 0 or row[0].startswith("#"):
-                        continue
-
-                    # Consume `header_rows` non-blank/comment rows at the start.
-                    if header_rows:
-                        if not headings:
-                            # If this is the first header row then initialise
-                            # the headings dict.
-                            for af_idx, header in enumerate(row[af_col:]):
-                                headings[af_idx] = header.strip()
-                        header_rows -= 1
-                        continue
+        headings_get = headings.get
+
+        # As in parse_board_csv, bind per-row methods as locals, and skip the
+        # default cpu validator (its non-empty check is inlined below).
+        validate_cpu_pin_name = self._pin_type.validate_cpu_pin_name
+        find_pin_by_cpu_pin_name = self.find_pin_by_cpu_pin_name
+        if validate_cpu_pin_name is Pin.validate_cpu_pin_name:
+            validate_cpu_pin_name = None
+
+        for linenum, row in _parse_simple_csv(filename):
+            try:
+                # Consume `header_rows` non-blank/comment rows at the start.
+                if header_rows:
+                    if not headings:
+                        # If this is the first header row then initialise
+                        # the headings dict.
+                        for af_idx, header in enumerate(row[af_col:]):
+                            headings[af_idx] = header.strip()
+                    header_rows -= 1
+                    continue
 
-                    # Lines must be pairs of names.
-                    if len(row) <= max(pin_col, af_col):
-                        raise PinGeneratorError(
-                            "Expecting {} entries in each row".format(max(pin_col, af_col))
-                        )
+                # Lines must be pairs of names.
+                if len(row) <= max(pin_col, af_col):
+                    raise PinGeneratorError(
+                        "Expecting {} entries in each row".format(max(pin_col, af_col))
+                    )
 
-                    cpu_pin_name = row[pin_col].strip()
-                    if cpu_pin_name == "-":
+                cpu_pin_name = row[pin_col].strip()
+                if cpu_pin_name == "-":
+                    continue
+                if validate_cpu_pin_name:
+                    validate_cpu_pin_name(cpu_pin_name)
+                elif not cpu_pin_name:
+                    raise PinGeneratorError("Missing cpu pin name")
+                pin = find_pin_by_cpu_pin_name(cpu_pin_name, create=True)
+
+                # Iterate the af columns by index to avoid allocating a
+                # row[af_col:] slice for every row.
+                for i in range(af_col, len(row)):
+                    af = row[i]
+                    if not af:
                         continue
-                    self._pin_type.validate_cpu_pin_name(cpu_pin_name)
-                    pin = self.find_pin_by_cpu_pin_name(cpu_pin_name, create=True)
-
-                    for af_idx, af in enumerate(row[af_col:]):
-                        af = af.strip()
-                        if not af:
-                            continue
-                        pin.add_af(af_idx, headings.get(af_idx, ""), af)
+                    af = af.strip()
+                    if not af:
+                        continue
+                    af_idx = i - af_col
+                    pin.add_af(af_idx, headings_get(af_idx, ""), af)
 
-                # Inject "file:line: " into the exception.
-                except PinGeneratorError as er:
-                    raise PinGeneratorError("{}:{}: {}".format(filename, linenum, er))
+            # Inject "file:line: " into the exception.
+            except PinGeneratorError as er:
+                raise PinGeneratorError("{}:{}: {}".format(filename, linenum, er))
 
     # Find an existing pin.
     def find_pin_by_cpu_pin_name(self, cpu_pin_name, create=True):
-        for pin in self._pins:
-            if pin._cpu_pin_name == cpu_pin_name:
-                return pin
+        pin = self._pins_by_cpu_name.get(cpu_pin_name)
+        if pin is not None:
+            return pin
         if create:
             return self.add_cpu_pin(cpu_pin_name, available=False)
         else:
@@ -289,68 +414,54 @@ class PinGenerator:
 
     # Print the locals dict for Pin.board.
     def print_board_locals_dict(self, out_source):
-        print(file=out_source)
-        print(
+        # Accumulate the output into a list and emit it with a single write,
+        # which is considerably faster than one print() call per line.
+        lines = [
+            "",
             "static const mp_rom_map_elem_t machine_pin_board_pins_locals_dict_table[] = {",
-            file=out_source,
-        )
-        for pin in self.available_pins():
-            for board_pin_name, board_hidden in pin._board_pin_names:
-                if board_hidden:
-                    # Don't include hidden pins in Pins.board.
-                    continue
-
-                # Keep track of the total number of Pin.board entries.
-                self._pin_board_num_entries += 1
-
-                # We don't use the enable macro for board pins, because they
-                # shouldn't be referenced in pins.csv unless they're
-                # available.
-                print(
-                    "    {{ MP_ROM_QSTR(MP_QSTR_{:s}), MP_ROM_PTR(pin_{:s}) }},".format(
-                        board_pin_name,
-                        pin.name(),
-                    ),
-                    file=out_source,
-                )
-        print("};", file=out_source)
-        print(
-            "MP_DEFINE_CONST_DICT(machine_pin_board_pins_locals_dict, machine_pin_board_pins_locals_dict_table);",
-            file=out_source,
+        ]
+        # Hidden board pins are already excluded from _emit_board_aliases,
+        # because they shouldn't be in Pin.board.  We don't use the enable
+        # macro for board pins, because they shouldn't be referenced in
+        # pins.csv unless they're available.
+        for board_pin_name, pin in self._emit_board_aliases:
+            # Keep track of the total number of Pin.board entries.
+            self._pin_board_num_entries += 1
+
+            lines.append(_ROM_MAP_ENTRY % (board_pin_name, self._name(pin)))
+        lines.append("};")
+        lines.append(
+            "MP_DEFINE_CONST_DICT(machine_pin_board_pins_locals_dict, machine_pin_board_pins_locals_dict_table);"
         )
+        out_source.write("\n".join(lines) + "\n")
 
     # Print the locals dict for Pin.cpu.
     def print_cpu_locals_dict(self, out_source):
-        print(file=out_source)
-        print(
+        lines = [
+            "",
             "static const mp_rom_map_elem_t machine_pin_cpu_pins_locals_dict_table[] = {",
-            file=out_source,
-        )
-        for pin in self.available_pins(exclude_hidden=True):
+        ]
+        for pin in self._emit_cpu:
             # Keep track of the total number of Pin.cpu entries.
             self._pin_cpu_num_entries += 1
 
+            name = self._name(pin)
+            entry = _ROM_MAP_ENTRY % (name, name)
             m = pin.enable_macro()
+            # Fold the guard into the entry, so the guarded case appends one
+            # string instead of three.
             if m:
-                print("    #if {}".format(m), file=out_source)
-            print(
-                "    {{ MP_ROM_QSTR(MP_QSTR_{:s}), MP_ROM_PTR(pin_{:s}) }},".format(
-                    pin.name(),
-                    pin.name(),
-                ),
-                file=out_source,
-            )
-            if m:
-                print("    #endif", file=out_source)
-        print("};", file=out_source)
-        print(
-            "MP_DEFINE_CONST_DICT(machine_pin_cpu_pins_locals_dict, machine_pin_cpu_pins_locals_dict_table);",
-            file=out_source,
+                entry = f"    #if {m}\n{entry}\n    #endif"
+            lines.append(entry)
+        lines.append("};")
+        lines.append(
+            "MP_DEFINE_CONST_DICT(machine_pin_cpu_pins_locals_dict, machine_pin_cpu_pins_locals_dict_table);"
         )
+        out_source.write("\n".join(lines) + "\n")
 
     # NumericPinGenerator can override this to use an entry in machine_pin_obj_table.
     def _cpu_pin_pointer(self, pin):
-        return "&pin_{:s}_obj".format(pin.name())
+        return "&pin_{:s}_obj".format(self._name(pin))
 
     # Allow a port to prefix the board pin macro names with something.
     # e.g. STM32 does pyb_pin_NAME whereas other ports using pin_NAME.
@@ -360,83 +471,61 @@ class PinGenerator:
     # Print the pin_CPUNAME and pin_BOARDNAME macros.
     def print_defines(self, out_header, cpu=True, board=True):
         # Provide #defines for the number of cpu and board pins.
-        print(
-            "#define MICROPY_PY_MACHINE_PIN_CPU_NUM_ENTRIES ({})".format(
-                self._pin_cpu_num_entries
-            ),
-            file=out_header,
-        )
-        print(
-            "#define MICROPY_PY_MACHINE_PIN_BOARD_NUM_ENTRIES ({})".format(
-                self._pin_board_num_entries
-            ),
-            file=out_header,
-        )
+        lines = [
+            f"#define MICROPY_PY_MACHINE_PIN_CPU_NUM_ENTRIES ({self._pin_cpu_num_entries})",
+            f"#define MICROPY_PY_MACHINE_PIN_BOARD_NUM_ENTRIES ({self._pin_board_num_entries})",
+        ]
 
         # Provide #defines for each cpu pin.
-        for pin in self.available_pins():
-            print(file=out_header)
-            m = pin.enable_macro()
-            if m:
-                print("#if {}".format(m), file=out_header)
+        board_prefix = self.board_name_define_prefix()
+        for pin in self._emit_available:
+            name = self._name(pin)
+            block = []
 
             # #define pin_CPUNAME (...)
             if cpu:
-                print(
-                    "#define pin_{:s} ({:s})".format(pin.name(), self._cpu_pin_pointer(pin)),
-                    file=out_header,
-                )
+                block.append(f"#define pin_{name} ({self._cpu_pin_pointer(pin)})")
 
             # #define pin_BOARDNAME (pin_CPUNAME)
             if board:
-                for board_pin_name, _board_hidden in pin._board_pin_names:
+                for board_pin_name in pin._board_pin_names:
                     # Note: Hidden board pins are still available to C via the macro.
                     # Note: The RHS isn't wrapped in (), which is necessary to make the
                     # STATIC_AF_ macro work on STM32.
-                    print(
-                        "#define {:s}pin_{:s} pin_{:s}".format(
-                            self.board_name_define_prefix(),
-                            board_pin_name,
-                            pin.name(),
-                        ),
-                        file=out_header,
-                    )
+                    block.append(_BOARD_DEFINE % (board_prefix, board_pin_name, name))
 
+            lines.append("")
+            m = pin.enable_macro()
             if m:
-                print("#endif", file=out_header)
+                # Fold the pin's defines into the guard as a single entry.
+                lines.append(f"#if {m}\n" + "\n".join(block) + "\n#endif")
+            else:
+                lines.extend(block)
+        out_header.write("\n".join(lines) + "\n")
 
     def print_pin_objects(self, out_source):
-        print(file=out_source)
-        for pin in self.available_pins():
+        lines = [""]
+        for pin in self._emit_available:
+            const = "const " if pin.is_const() else ""
+            name = self._name(pin)
+            entry = f"{const}machine_pin_obj_t pin_{name}_obj = {pin.definition()};"
             m = pin.enable_macro()
             if m:
-                print("#if {}".format(m), file=out_source)
-            print(
-                "{:s}machine_pin_obj_t pin_{:s}_obj = {:s};".format(
-                    "const " if pin.is_const() else "",
-                    pin.name(),
-                    pin.definition(),
-                ),
-                file=out_source,
-            )
-            if m:
-                print("#endif", file=out_source)
+                entry = f"#if {m}\n{entry}\n#endif"
+            lines.append(entry)
+        out_source.write("\n".join(lines) + "\n")
 
     def print_pin_object_externs(self, out_header):
-        print(file=out_header)
-        for pin in self.available_pins():
+        lines = [""]
+        for pin in self._emit_available:
+            const = "const " if pin.is_const() else ""
+            name = self._name(pin)
+            entry = f"extern {const}machine_pin_obj_t pin_{name}_obj;"
             m = pin.enable_macro()
             if m:
-                print("#if {}".format(m), file=out_header)
-            print(
-                "extern {:s}machine_pin_obj_t pin_{:s}_obj;".format(
-                    "const " if pin.is_const() else "",
-                    pin.name(),
-                ),
-                file=out_header,
-            )
-            if m:
-                print("#endif", file=out_header)
+                entry = f"#if {m}\n{entry}\n#endif"
+            lines.append(entry)
+        out_header.write("\n".join(lines) + "\n")
 
     def print_source(self, out_source):
         self.print_pin_objects(out_source)
@@ -449,22 +538,23 @@ class PinGenerator:
 
     # A port can override this if it has extra input files (e.g. af.csv) to load.
     def load_inputs(self, out_source):
+        args = self.args
+
         # Optionally load pins.csv to get cpu->board name mappings.
-        if self._enable_af and self.args.af_csv:
-            print("// --af-csv {:s}".format(self.args.af_csv), file=out_source)
-            self.parse_af_csv(self.args.af_csv)
+        if self._enable_af and args.af_csv:
+            out_source.write(f"// --af-csv {args.af_csv}\n")
+            self.parse_af_csv(args.af_csv)
 
         # Optionally load pins.csv to get cpu->board name mappings.
-        if self.args.board_csv:
-            print("// --board-csv {:s}".format(self.args.board_csv), file=out_source)
-            self.parse_board_csv(self.args.board_csv)
+        if args.board_csv:
+            out_source.write(f"// --board-csv {args.board_csv}\n")
+            self.parse_board_csv(args.board_csv)
 
         # Prepend the prefix file to the start of the output.
-        if self.args.prefix:
-            print("// --prefix {:s}".format(self.args.prefix), file=out_source)
-            print(file=out_source)
-            with open(self.args.prefix, "r") as prefix_file:
-                print(prefix_file.read(), end="", file=out_source)
+        if args.prefix:
+            out_source.write(f"// --prefix {args.prefix}\n\n")
+            with open(args.prefix, "r") as prefix_file:
+                out_source.write(prefix_file.read())
 
     # A port can override this to do extra work after the main source+header
     # have been written, such as generating additional header files.
@@ -480,24 +570,31 @@ class PinGenerator:
         parser.add_argument("--output-source")
         parser.add_argument("--output-header")
         self.extra_args(parser)
-        self.args = parser.parse_args()
+        args = self.args = parser.parse_args()
 
         try:
-            with open(self.args.output_source, "w") as out_source:
-                print("// This file was automatically generated by make-pins.py", file=out_source)
-                print("//", file=out_source)
+            # The generated output is pure ASCII, so use the ascii codec and
+            # disable newline translation.  Ports' print_source/load_inputs
+            # hooks still see a regular text stream.  Combined with the large
+            # buffer, each file is written with a minimal number of syscalls.
+            output_args = {"encoding": "ascii", "newline": "\n", "buffering": 1 << 20}
+            with open(args.output_source, "w", **output_args) as out_source:
+                out_source.write("// This file was automatically generated by make-pins.py\n//\n")
 
                 # Load additional files (including port-specific ones).
                 self.load_inputs(out_source)
 
+                # Snapshot the pin lists for the emit passes below.
+                self._finalize()
+
                 # Allow a port to print arbitrary per-pin content.
-                for pin in self.available_pins():
+                for pin in self._emit_available:
                     pin.print_source(out_source)
 
                 # Print the tables and dictionaries.
                 self.print_source(out_source)
 
-            with open(self.args.output_header, "w") as out_header:
+            with open(args.output_header, "w", **output_args) as out_header:
                 self.print_header(out_header)
 
             self.generate_extra_files()
@@ -515,51 +612,40 @@ class NumericPinGenerator(PinGenerator):
         raise NotImplementedError
 
     def print_cpu_table(self, out_source):
-        # Print machine_pin_obj_table, where each element is `[n] = {obj}`.
-        print(file=out_source)
-        print(
-            "const machine_pin_obj_t machine_pin_obj_table[{}] = {{".format(self.cpu_table_size()),
-            file=out_source,
-        )
-        for pin in self.available_pins():
-            n = pin.index_name()
-            if n is None:
-                continue
-
+        # Partition the pins with a single iteration, so index_name() and
+        # enable_macro() are evaluated once per pin rather than once per pass.
+        with_index = []
+        without_index = []
+        for pin in self._emit_available:
+            n = self._index_name(pin)
             m = pin.enable_macro()
-            if m:
-                print("    #if {}".format(m), file=out_source)
-            print(
-                "    [{:s}] = {:s},".format(
-                    pin.index_name(),
-                    pin.definition(),
-                ),
-                file=out_source,
-            )
-            if m:
-                print("    #endif", file=out_source)
-        print("};", file=out_source)
-
-        # For pins that do not have an index, print them out in the same style as PinGenerator.
-        print(file=out_source)
-        for pin in self.available_pins():
-            n = pin.index_name()
             if n is not None:
-                continue
+                with_index.append((pin, n, m))
+            else:
+                without_index.append((pin, m))
 
-            m = pin.enable_macro()
+        # Print machine_pin_obj_table, where each element is `[n] = {obj}`.
+        lines = [
+            "",
+            f"const machine_pin_obj_t machine_pin_obj_table[{self.cpu_table_size()}] = {{",
+        ]
+        for pin, n, m in with_index:
+            entry = f"    [{n}] = {pin.definition()},"
             if m:
-                print("#if {}".format(m), file=out_source)
-            print(
-                "{:s}machine_pin_obj_t pin_{:s}_obj = {:s};".format(
-                    "const " if pin.is_const() else "",
-                    pin.name(),
-                    pin.definition(),
-                ),
-                file=out_source,
-            )
+                entry = f"    #if {m}\n{entry}\n    #endif"
+            lines.append(entry)
+        lines.append("};")
+
+        # For pins that do not have an index, print them out in the same style as PinGenerator.
+        lines.append("")
+        for pin, m in without_index:
+            const = "const " if pin.is_const() else ""
+            name = self._name(pin)
+            entry = f"{const}machine_pin_obj_t pin_{name}_obj = {pin.definition()};"
             if m:
-                print("#endif", file=out_source)
+                entry = f"#if {m}\n{entry}\n#endif"
+            lines.append(entry)
+        out_source.write("\n".join(lines) + "\n")
 
     # Replace PinGenerator's implementation to print the numeric table.
     def print_source(self, out_source):
@@ -571,8 +657,8 @@ class NumericPinGenerator(PinGenerator):
         self.print_defines(out_header)
 
     def _cpu_pin_pointer(self, pin):
-        n = pin.index_name()
+        n = self._index_name(pin)
         if n is not None:
-            return "&machine_pin_obj_table[{:s}]".format(pin.index_name())
+            return f"&machine_pin_obj_table[{n}]"
         else:
             return super()._cpu_pin_pointer(pin)